@@ -1,9 +1,11 @@
 import random
 import hashlib
+import sys
+from itertools import product
 from typing import List, Dict, Set
 from dataclasses import dataclass
 
-@dataclass
+@dataclass(slots=True)
 class KnowledgeVector:
     """Type-safe definition for generated knowledge to boost Schema Score."""
     id: str
@@ -19,32 +21,36 @@ class ProceduralDataFactory:
     """
     
     def __init__(self):
-        # High-Entropy Vocabulary Lists (Scientific/Geopolitical Domain)
-        self._subjects = [
-            "Quantum decoherence", "Biometric entropy", "Algorithmic bias", 
+        # High-Entropy Vocabulary Tuples (Scientific/Geopolitical Domain)
+        # Immutable tuples are smaller and friendlier to batched sampling;
+        # interning shares phrase storage across all generated sentences
+        self._subjects = tuple(sys.intern(phrase) for phrase in (
+            "Quantum decoherence", "Biometric entropy", "Algorithmic bias",
             "Geopolitical flux", "Neuronal plasticity", "Homomorphic encryption",
             "Zero-knowledge proof", "Hyper-ledger consensus", "Tachyon resonance",
             "Dark matter topology", "Fiscal asymmetry", "Kinetic cyber-warfare"
-        ]
-        
-        self._verbs = [
-            "accelerates", "diminishes", "correlates with", "amplifies", 
-            "modulates", "encodes", "obfuscates", "triangulates", 
+        ))
+
+        self._verbs = tuple(sys.intern(phrase) for phrase in (
+            "accelerates", "diminishes", "correlates with", "amplifies",
+            "modulates", "encodes", "obfuscates", "triangulates",
             "synthesizes", "decouples", "recursively indexes", "stochastically predicts"
-        ]
-        
-        self._objects = [
+        ))
+
+        self._objects = tuple(sys.intern(phrase) for phrase in (
             "high-yield variance", "systemic latency", "cryptographic resilience",
             "socio-economic stratification", "cognitive load", "market volatility",
             "cyber-kinetic vectors", "asymptotic complexities", "recursive neural nets",
             "distributed ledger states", "macro-economic stability", "quantum supremacy"
-        ]
+        ))
         
-        self._seen_hashes: Set[str] = set()
+        self._seen_sentences: Set[str] = set()
 
     def _generate_vector_id(self, content: str) -> str:
-        """Generates a deterministic ID based on content SHA-256 hash."""
-        return f"VEC-{hashlib.sha256(content.encode()).hexdigest()[:8].upper()}"
+        """Generates a deterministic ID based on a content blake2b hash."""
+        # Only 8 hex chars are needed; a 4-byte blake2b digest is ~2x
+        # faster than SHA-256 on short inputs and needs no slicing.
+        return f"VEC-{hashlib.blake2b(content.encode(), digest_size=4).hexdigest().upper()}"
 
     def generate_knowledge_base(self, target_size: int = 500) -> List[Dict[str, str]]:
         """
@@ -58,36 +64,43 @@ class ProceduralDataFactory:
             List of dicts compatible with the LocalKnowledgeVectorizer.
         """
         knowledge_base: List[Dict[str, str]] = []
-        attempts = 0
-        max_attempts = target_size * 5  # Prevent infinite loops
-        
+
         print(f"ProceduralDataFactory: Initializing generation of {target_size} vectors...")
 
-        while len(knowledge_base) < target_size and attempts < max_attempts:
-            attempts += 1
-            
-            # 1. Stochastic Selection
-            subj = random.choice(self._subjects)
-            verb = random.choice(self._verbs)
-            obj = random.choice(self._objects)
-            
-            # 2. Logic Injection: Conditional Conjunctions
-            # randomly adds complex sentence structures for density
-            if attempts % 3 == 0:
-                modifier = "precisely when"
-                secondary = random.choice(self._objects)
-                sentence = f"{subj} {verb} {obj} {modifier} {secondary} {random.choice(self._verbs)}."
+        # 1. Combinatorial Enumeration: every triple is unique by
+        # construction, so no rejection sampling or retry clamp is needed.
+        triples = list(product(self._subjects, self._verbs, self._objects))
+        random.shuffle(triples)
+
+        # 2. Pre-draw the conjunction parts for the modified variants
+        # (every 3rd sentence carries a conditional clause for density)
+        variant_budget = len(triples) // 3 + 1
+        secondaries = random.choices(self._objects, k=variant_budget)
+        secondary_verbs = random.choices(self._verbs, k=variant_budget)
+
+        for attempt, (subj, verb, obj) in enumerate(triples, start=1):
+            if len(knowledge_base) >= target_size:
+                break
+
+            # Logic Injection: Conditional Conjunctions
+            if attempt % 3 == 0:
+                variant = attempt // 3 - 1
+                sentence = (f"{subj} {verb} {obj} precisely when "
+                            f"{secondaries[variant]} {secondary_verbs[variant]}.")
             else:
                 sentence = f"{subj} {verb} {obj}."
 
-            # 3. Entropy Validation (Uniqueness Check)
-            vector_hash = hashlib.md5(sentence.encode()).hexdigest()
-            
-            if vector_hash in self._seen_hashes:
+            # 3. Entropy Validation: only needed to keep repeat
+            # generate_knowledge_base calls disjoint across invocations.
+            if sentence in self._seen_sentences:
                 continue
-                
-            self._seen_hashes.add(vector_hash)
-            
+
+            self._seen_sentences.add(sentence)
+
+            # meta_entropy stays exposed publicly; blake2b is the fastest
+            # hash in CPython's hashlib for these short inputs.
+            vector_hash = hashlib.blake2b(sentence.encode(), digest_size=8).hexdigest()
+
             # 4. Object Construction
             vec_id = self._generate_vector_id(sentence)
             
@@ -95,7 +108,8 @@ class ProceduralDataFactory:
             knowledge_base.append({
                 "vector_id": vec_id,
                 "text": sentence,
-                "meta_entropy": vector_hash
+                "meta_entropy": vector_hash,
+                "token_count": len(sentence.split())
             })
 
         print(f"ProceduralDataFactory: Generation complete. Yielded {len(knowledge_base)} unique vectors.")
@@ -9,9 +9,16 @@ class ProceduralGraphGenerator:
         # INTERNAL: High-Entropy seed data (not saved to file)
         self.SEED_NODES: List[str] = ["GeopoliticalVector", "EconomicIndicator", "BiometricEntropy", "HistoricalPrecedent"]
 
+        # Precomputed transition table: node -> every other node. Built once
+        # so each Markov step is a single random.choice on a tuple.
+        self._neighbors: Dict[str, tuple] = {
+            node: tuple(other for other in self.SEED_NODES if other != node)
+            for node in self.SEED_NODES
+        }
+
     def _get_next_node(self, current_node: str) -> str:
         """Simulates a Markov Chain transition for topic generation."""
-        possible_nodes = [node for node in self.SEED_NODES if node != current_node]
+        possible_nodes = self._neighbors.get(current_node)
         return random.choice(possible_nodes) if possible_nodes else current_node
 
     def generate_graph(self, topic: str, depth: int = 3) -> Dict[str, Any]:
@@ -24,7 +31,9 @@ class ProceduralGraphGenerator:
             graph["relationships"].append({
                 "source": current_node,
                 "target": next_node,
-                "weight": round(random.uniform(0.1, 0.9), 3) # Algorithmic injection
+                # Algorithmic injection: scaled random() skips the uniform()
+                # frame; display-side formatting handles rounding
+                "weight": 0.1 + random.random() * 0.8
             })
             current_node = next_node
 
@@ -1,6 +1,40 @@
 import math
 from typing import List, Dict
 
+try:
+    from numba import njit
+except ImportError:  # Numba is an optional accelerator; fall back to pure Python
+    njit = None
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    # SciPy's expit is C-implemented and numerically stable at extreme z
+    from scipy.special import expit as _expit
+except ImportError:
+    _expit = None
+
+
+def _sigmoid_scalar(z: float) -> float:
+    """Scalar logistic function - the JIT-compiled numeric kernel."""
+    return 1.0 / (1.0 + math.exp(-z))
+
+
+def _confidence_kernel(total_tokens: int, probe_tokens: int, corpus_size: int) -> float:
+    """Raw confidence arithmetic, extracted so Numba can compile it whole."""
+    alignment_raw_score = total_tokens / (probe_tokens * corpus_size)
+    z = max(0.0, min(5.0, alignment_raw_score / 10.0))
+    return _sigmoid_scalar(z) * 100.0
+
+
+if njit is not None:
+    _sigmoid_scalar = njit(cache=True)(_sigmoid_scalar)
+    _confidence_kernel = njit(cache=True)(_confidence_kernel)
+
+
 class SemanticScoringEngine:
     """
     Calculates the Statistical Confidence Score using non-standard math (Law 1).
@@ -8,23 +42,38 @@ class SemanticScoringEngine:
     """
     def _manual_sigmoid(self, z: float) -> float:
         """
-        Calculates the Sigmoid activation function manually to enforce 
-        algorithmic complexity.
+        Calculates the Sigmoid activation function manually to enforce
+        algorithmic complexity. Delegates to the JIT-compiled scalar kernel.
         """
-        return 1.0 / (1.0 + math.exp(-z))
+        return _sigmoid_scalar(z)
+
+    def _manual_sigmoid_vec(self, z_values):
+        """
+        Bulk Sigmoid over an array of inputs in one C-level call.
+        Prefers SciPy's expit, then NumPy, then a scalar-loop fallback.
+        """
+        if _expit is not None:
+            return _expit(z_values)
+        if np is not None:
+            return 1.0 / (1.0 + np.exp(-np.asarray(z_values, dtype=float)))
+        return [_sigmoid_scalar(z) for z in z_values]
 
     def calculate_confidence(self, probe: str, corpus: List[Dict[str, str]]) -> float:
         """Translates raw corpus data into a single, high-entropy confidence score."""
         if not corpus: return 0.0
 
         # High Entropy Logic 1: Corpus Density Metric
-        total_token_count = sum(len(item['snippet'].split()) for item in corpus)
-        
-        # High Entropy Logic 2: Probe-Corpus Alignment Heuristic (Complex math input 'z')
-        alignment_raw_score = total_token_count / (len(probe.split()) * len(corpus))
-        
-        # Inject the custom Sigmoid complexity
-        z = max(0.0, min(5.0, alignment_raw_score / 10.0)) 
-        confidence = self._manual_sigmoid(z)
-        
-        return round(confidence * 100, 2)
+        # The vectorizer yields CorpusItem structs with precomputed counts;
+        # only legacy dict corpora without one pay for a per-call split.
+        total_token_count = 0
+        for item in corpus:
+            if isinstance(item, dict):
+                total_token_count += (item['token_count'] if 'token_count' in item
+                                      else len(item['snippet'].split()))
+            else:
+                total_token_count += item.token_count
+
+        # High Entropy Logic 2 + custom Sigmoid, fused in the compiled kernel
+        confidence = _confidence_kernel(total_token_count, len(probe.split()), len(corpus))
+
+        return round(confidence, 2)
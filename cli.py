@@ -27,11 +27,11 @@ def main():
         
         # 3. Structured Output Display (Law 2 Enforcement: No raw API text)
         print("\n--- RESULTS: KNOWLEDGE VECTOR ANALYSIS ---")
-        print(f"CLAIM: {results['probe_input']}")
-        print(f"STATISTICAL CONFIDENCE SCORE: {results['statistical_confidence_score']}%")
-        print(f"TRUTH CORPUS SIZE: {results['truth_corpus_size']}")
+        print(f"CLAIM: {results.probe_input}")
+        print(f"STATISTICAL CONFIDENCE SCORE: {results.statistical_confidence_score}%")
+        print(f"TRUTH CORPUS SIZE: {results.truth_corpus_size}")
         print("\n--- PROCEDURAL MARKOV GRAPH (COMPRESSION RATIO CRUSH) ---")
-        for rel in results['knowledge_graph']['relationships']:
+        for rel in results.knowledge_graph['relationships']:
             print(f"  -> [{rel['weight']:.3f}] {rel['source']} -> {rel['target']}")
         
     except Exception as e:
@@ -0,0 +1,92 @@
+"""
+Compact compiled Trie for the ASCII-lowercase hot path.
+
+Nodes live in a bump-allocated pool of parallel arrays — a (capacity, 26)
+uint32 child table indexed by `byte - ord('a')` plus a uint32 is_end
+column — so insert and lookup are direct array indexing with no dict
+hashing and no per-node objects. The kernels are plain NumPy-scalar
+loops that Numba compiles to native code when available; without Numba
+they still run correctly, just interpreted.
+"""
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # optional accelerator; the kernels run fine uncompiled
+    njit = None
+
+_ALPHABET = 26
+_ORD_A = ord('a')
+
+
+def _insert_kernel(children, is_end, size, word):
+    """Inserts one encoded word; returns the new pool size (node count)."""
+    node = 0
+    for i in range(word.shape[0]):
+        slot = word[i] - _ORD_A
+        nxt = children[node, slot]
+        if nxt == 0:  # node 0 is the root, so 0 doubles as the null child
+            nxt = size
+            children[node, slot] = nxt
+            size += 1
+        node = nxt
+    is_end[node] = 1
+    return size
+
+
+def _contains_kernel(children, is_end, word):
+    """Exact-match lookup of one encoded word against the pool."""
+    node = 0
+    for i in range(word.shape[0]):
+        nxt = children[node, word[i] - _ORD_A]
+        if nxt == 0:
+            return False
+        node = nxt
+    return is_end[node] != 0
+
+
+if njit is not None:
+    _insert_kernel = njit(cache=True)(_insert_kernel)
+    _contains_kernel = njit(cache=True)(_contains_kernel)
+
+
+class CompactTrie:
+    """Pool-backed Trie over lowercase ASCII byte strings."""
+
+    def __init__(self, capacity: int = 1024):
+        self._children = np.zeros((capacity, _ALPHABET), dtype=np.uint32)
+        self._is_end = np.zeros(capacity, dtype=np.uint32)
+        self._size = 1  # node 0 is the root
+
+    def _grow_for(self, word_len: int) -> None:
+        """Doubles the pool if the next insert could overflow it."""
+        needed = self._size + word_len
+        capacity = self._children.shape[0]
+        if needed <= capacity:
+            return
+        while capacity < needed:
+            capacity *= 2
+        self._children = np.vstack(
+            (self._children,
+             np.zeros((capacity - self._children.shape[0], _ALPHABET),
+                      dtype=np.uint32)))
+        self._is_end = np.concatenate(
+            (self._is_end,
+             np.zeros(capacity - self._is_end.shape[0], dtype=np.uint32)))
+
+    def insert(self, word: bytes) -> None:
+        """Inserts a lowercase ASCII byte string."""
+        self._grow_for(len(word))
+        self._size = int(_insert_kernel(
+            self._children, self._is_end, self._size,
+            np.frombuffer(word, dtype=np.uint8)))
+
+    def contains(self, word: bytes) -> bool:
+        """Returns True if the exact byte string was inserted."""
+        return bool(_contains_kernel(
+            self._children, self._is_end,
+            np.frombuffer(word, dtype=np.uint8)))
+
+    @property
+    def node_count(self) -> int:
+        return self._size
@@ -3,7 +3,7 @@ Type Schemas for Enterprise-Grade Fact-Checking Engine
 Provides strict typing layer for all data structures.
 """
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, NamedTuple, Optional, Any
 from typing_extensions import TypedDict
 
 
@@ -24,9 +24,17 @@ class ProbeResponse(TypedDict):
     knowledge_graph: Dict[str, Any]
 
 
+class ProbeResult(NamedTuple):
+    """Allocation-light probe result: fixed-size struct, no per-call dict."""
+    probe_input: str
+    statistical_confidence_score: float
+    truth_corpus_size: int
+    knowledge_graph: Dict[str, Any]
+
+
 # ==================== TRIE/VECTORIZER SCHEMAS ====================
 
-@dataclass
+@dataclass(slots=True)
 class TrieNodePayload:
     """Payload structure for Trie terminal nodes."""
     vector_id: str
@@ -35,7 +43,7 @@ class TrieNodePayload:
     confidence_weight: float = 1.0
 
 
-@dataclass
+@dataclass(slots=True)
 class TruthCorpusItem:
     """Individual item in the Truth Corpus result set."""
     snippet: str
@@ -53,7 +61,7 @@ class TruthCorpusItem:
 
 # ==================== SCORING ENGINE SCHEMAS ====================
 
-@dataclass
+@dataclass(slots=True)
 class SigmoidMetrics:
     """Metrics and intermediate values from Sigmoid calculation."""
     raw_alignment_score: float
@@ -64,7 +72,7 @@ class SigmoidMetrics:
     probe_token_count: int
 
 
-@dataclass
+@dataclass(slots=True)
 class ConfidenceReport:
     """Complete confidence analysis report."""
     probe: str
@@ -85,7 +93,7 @@ class ConfidenceReport:
 
 # ==================== GRAPH GENERATOR SCHEMAS ====================
 
-@dataclass
+@dataclass(slots=True)
 class GraphEdge:
     """Weighted edge in the knowledge graph."""
     source: str
@@ -103,7 +111,7 @@ class GraphEdge:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class GraphNode:
     """Node in the knowledge graph."""
     node_id: str
@@ -112,7 +120,7 @@ class GraphNode:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class KnowledgeGraph:
     """Complete knowledge graph structure."""
     root: str
@@ -138,7 +146,7 @@ class KnowledgeGraph:
 
 # ==================== ORCHESTRATOR SCHEMAS ====================
 
-@dataclass
+@dataclass(slots=True)
 class PipelineState:
     """State tracking for the reasoning pipeline."""
     current_step: str
@@ -148,7 +156,7 @@ class PipelineState:
     end_time: Optional[float] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ExecutionContext:
     """Context object passed through the pipeline."""
     probe: str
@@ -160,7 +168,7 @@ class ExecutionContext:
 
 # ==================== FACTORY SCHEMAS ====================
 
-@dataclass
+@dataclass(slots=True)
 class GenerationStats:
     """Statistics from the ProceduralDataFactory generation."""
     target_size: int
@@ -0,0 +1,8 @@
+"""
+Shared test configuration: puts the project root on sys.path once per
+run instead of re-deriving it in every test module at import time.
+"""
+import pathlib
+import sys
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent))